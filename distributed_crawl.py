@@ -0,0 +1,588 @@
+import argparse
+import json
+import os
+import re
+import socket
+import sqlite3
+import sys
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from movie_scraper import MovieReviewScraper, AIReviewGenerator, ReviewArchive
+
+try:
+    import redis
+except ImportError:  # Only needed for the redis:// backend
+    redis = None
+
+REVIEW_FIELDS = ('rating', 'title', 'content', 'date', 'author')
+
+# Errors that mean the queue backend is briefly unavailable rather than that
+# the title is bad; workers back off and retry them instead of exiting
+BACKEND_ERRORS = (sqlite3.OperationalError, ConnectionError, TimeoutError)
+if redis is not None:
+    BACKEND_ERRORS += (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)
+
+def title_key(title):
+    """Normalise a movie title so the same title is only queued once"""
+    return re.sub(r'\s+', ' ', title).strip().lower()
+
+class Lease:
+    """A title checked out by one worker until its visibility timeout expires"""
+
+    def __init__(self, key, title, attempts):
+        self.key = key
+        self.title = title
+        self.attempts = attempts
+
+class SQLiteWorkQueue:
+    """Shared work queue and result store in a single SQLite file.
+
+    A local stand-in for the Redis backend: every process on the host that
+    opens the same file shares the queue, leases, rate limits and results.
+    """
+
+    def __init__(self, path, visibility_timeout=300, max_attempts=3):
+        self.path = path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self._transaction() as cur:
+            cur.execute("""CREATE TABLE IF NOT EXISTS titles (
+                key TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                lease_owner TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                source TEXT,
+                error TEXT,
+                updated_at REAL NOT NULL)""")
+            cur.execute("CREATE INDEX IF NOT EXISTS titles_status ON titles (status, updated_at)")
+            cur.execute("""CREATE TABLE IF NOT EXISTS reviews (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT NOT NULL,
+                movie TEXT NOT NULL,
+                source TEXT,
+                rating TEXT, title TEXT, content TEXT, date TEXT, author TEXT)""")
+            cur.execute("CREATE INDEX IF NOT EXISTS reviews_key ON reviews (key)")
+            cur.execute("""CREATE TABLE IF NOT EXISTS rate_limits (
+                name TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL)""")
+
+    @contextmanager
+    def _transaction(self):
+        # BEGIN IMMEDIATE takes the write lock up front so lease checks and
+        # updates are atomic across processes
+        cur = self.conn.cursor()
+        cur.execute("BEGIN IMMEDIATE")
+        try:
+            yield cur
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
+        else:
+            cur.execute("COMMIT")
+
+    def enqueue(self, titles):
+        """Queue titles, skipping any already queued, in progress or finished"""
+        added = 0
+        now = time.time()
+        with self._transaction() as cur:
+            for title in titles:
+                key = title_key(title)
+                if not key:
+                    continue
+                cur.execute("INSERT OR IGNORE INTO titles (key, title, updated_at) VALUES (?, ?, ?)",
+                            (key, title.strip(), now))
+                added += cur.rowcount
+        return added
+
+    def lease(self, worker_id):
+        """Check out the next available title, or return None if there is none"""
+        now = time.time()
+        with self._transaction() as cur:
+            # Expired leases that have used up their attempts are given up on;
+            # pending titles go before reclaiming any other expired lease
+            cur.execute("""UPDATE titles SET status = 'failed', lease_owner = NULL,
+                               error = 'Lease expired too many times', updated_at = ?
+                           WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?""",
+                        (now, now, self.max_attempts))
+            row = cur.execute("""SELECT key, title, attempts FROM titles
+                                 WHERE status = 'pending'
+                                    OR (status = 'leased' AND lease_expires < ?)
+                                 ORDER BY status = 'leased', updated_at
+                                 LIMIT 1""", (now,)).fetchone()
+            if row is None:
+                return None
+            key, title, attempts = row
+            cur.execute("""UPDATE titles SET status = 'leased', lease_owner = ?, lease_expires = ?,
+                               attempts = attempts + 1, updated_at = ?
+                           WHERE key = ?""",
+                        (worker_id, now + self.visibility_timeout, now, key))
+        return Lease(key, title, attempts + 1)
+
+    def extend_lease(self, lease, worker_id):
+        """Push the lease's visibility timeout back; False if it was lost"""
+        now = time.time()
+        with self._transaction() as cur:
+            cur.execute("""UPDATE titles SET lease_expires = ?
+                           WHERE key = ? AND status = 'leased' AND lease_owner = ?""",
+                        (now + self.visibility_timeout, lease.key, worker_id))
+            return cur.rowcount == 1
+
+    def complete(self, lease, worker_id, reviews, source):
+        """Store the reviews for a leased title; False if the lease was lost"""
+        now = time.time()
+        with self._transaction() as cur:
+            cur.execute("""UPDATE titles SET status = 'done', lease_owner = NULL, source = ?,
+                               error = NULL, updated_at = ?
+                           WHERE key = ? AND status = 'leased' AND lease_owner = ?""",
+                        (source, now, lease.key, worker_id))
+            if cur.rowcount != 1:
+                return False
+            cur.executemany("""INSERT INTO reviews (key, movie, source, rating, title, content, date, author)
+                               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                            [(lease.key, lease.title, source,
+                              *(str(review.get(field, "")) for field in REVIEW_FIELDS))
+                             for review in reviews])
+        return True
+
+    def fail(self, lease, worker_id, error):
+        """Release a leased title for a retry, or mark it failed after max_attempts"""
+        now = time.time()
+        with self._transaction() as cur:
+            cur.execute("""UPDATE titles
+                           SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                               lease_owner = NULL, error = ?, updated_at = ?
+                           WHERE key = ? AND status = 'leased' AND lease_owner = ?""",
+                        (self.max_attempts, error, now, lease.key, worker_id))
+            return cur.rowcount == 1
+
+    def acquire(self, name, rate, burst=1):
+        """Take a token from the shared bucket; return seconds to wait if empty"""
+        now = time.time()
+        with self._transaction() as cur:
+            row = cur.execute("SELECT tokens, updated_at FROM rate_limits WHERE name = ?",
+                              (name,)).fetchone()
+            tokens = burst if row is None else min(burst, row[0] + (now - row[1]) * rate)
+            wait = 0 if tokens >= 1 else (1 - tokens) / rate
+            if not wait:
+                tokens -= 1
+            cur.execute("INSERT OR REPLACE INTO rate_limits (name, tokens, updated_at) VALUES (?, ?, ?)",
+                        (name, tokens, now))
+        return wait
+
+    def stats(self):
+        """Count titles per status"""
+        rows = self.conn.execute("SELECT status, COUNT(*) FROM titles GROUP BY status")
+        return dict(rows.fetchall())
+
+    def iter_reviews(self, title=None):
+        """Yield stored reviews, optionally only those for one title"""
+        query = f"SELECT movie, source, {', '.join(REVIEW_FIELDS)} FROM reviews"
+        params = ()
+        if title:
+            query += " WHERE key = ?"
+            params = (title_key(title),)
+        for row in self.conn.execute(query + " ORDER BY id", params):
+            review = dict(zip(REVIEW_FIELDS, row[2:]))
+            review['movie'], review['source'] = row[0], row[1]
+            yield review
+
+    def close(self):
+        self.conn.close()
+
+class RedisWorkQueue:
+    """Shared work queue and result store in Redis, for crawls across nodes.
+
+    Queue updates run in Lua scripts against the Redis server clock, so every
+    node sees the same ordering and expiry. All keys are passed in ``KEYS``
+    and share the ``{prefix}`` hash tag, so they live in one Redis Cluster
+    slot.
+    """
+
+    KEY_NAMES = ('titles', 'state', 'pending', 'leases', 'owners', 'attempts', 'errors', 'reviews')
+
+    SCRIPT_PREFIX = """
+    local titles, state, pending, leases, owners, attempts, errors, reviews = unpack(KEYS)
+    local now = redis.call('TIME')
+    now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+    """
+
+    ENQUEUE_SCRIPT = SCRIPT_PREFIX + """
+    local added = 0
+    for i = 1, #ARGV, 2 do
+        -- Dedup and queue in one step so a title is never known but unqueued
+        if redis.call('HSETNX', titles, ARGV[i], ARGV[i + 1]) == 1 then
+            redis.call('HSET', state, ARGV[i], 'pending')
+            redis.call('RPUSH', pending, ARGV[i])
+            added = added + 1
+        end
+    end
+    return added
+    """
+
+    LEASE_SCRIPT = SCRIPT_PREFIX + """
+    -- Pending titles go first; otherwise only the expired lease handed out
+    -- here is reclaimed. Expired leases that have used up their attempts are
+    -- given up on.
+    local key = redis.call('LPOP', pending)
+    for _, expired in ipairs(redis.call('ZRANGEBYSCORE', leases, '-inf', now)) do
+        if tonumber(redis.call('HGET', attempts, expired) or 0) >= tonumber(ARGV[3]) then
+            redis.call('ZREM', leases, expired)
+            redis.call('HDEL', owners, expired)
+            redis.call('HSET', state, expired, 'failed')
+            redis.call('HSET', errors, expired, 'Lease expired too many times')
+        elseif not key then
+            key = expired
+        end
+    end
+    if not key then return false end
+    redis.call('ZADD', leases, now + tonumber(ARGV[2]), key)
+    redis.call('HSET', owners, key, ARGV[1])
+    redis.call('HSET', state, key, 'leased')
+    local count = redis.call('HINCRBY', attempts, key, 1)
+    return {key, redis.call('HGET', titles, key), count}
+    """
+
+    OWNED_SCRIPT_PREFIX = SCRIPT_PREFIX + """
+    local key = ARGV[1]
+    -- An expired lease still belongs to its worker until another one takes it
+    if redis.call('HGET', owners, key) ~= ARGV[2] then
+        return 0
+    end
+    """
+
+    EXTEND_SCRIPT = OWNED_SCRIPT_PREFIX + """
+    redis.call('ZADD', leases, now + tonumber(ARGV[3]), key)
+    return 1
+    """
+
+    COMPLETE_SCRIPT = OWNED_SCRIPT_PREFIX + """
+    redis.call('ZREM', leases, key)
+    redis.call('HDEL', owners, key)
+    redis.call('HSET', state, key, 'done')
+    redis.call('HDEL', errors, key)
+    for i = 3, #ARGV do
+        redis.call('RPUSH', reviews, ARGV[i])
+    end
+    return 1
+    """
+
+    FAIL_SCRIPT = OWNED_SCRIPT_PREFIX + """
+    redis.call('ZREM', leases, key)
+    redis.call('HDEL', owners, key)
+    redis.call('HSET', errors, key, ARGV[3])
+    if tonumber(redis.call('HGET', attempts, key) or 0) >= tonumber(ARGV[4]) then
+        redis.call('HSET', state, key, 'failed')
+    else
+        redis.call('HSET', state, key, 'pending')
+        redis.call('RPUSH', pending, key)
+    end
+    return 1
+    """
+
+    ACQUIRE_SCRIPT = """
+    local now = redis.call('TIME')
+    now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+    local rate, burst = tonumber(ARGV[1]), tonumber(ARGV[2])
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+    local tokens = burst
+    if bucket[1] then
+        tokens = math.min(burst, tonumber(bucket[1]) + (now - tonumber(bucket[2])) * rate)
+    end
+    local wait = 0
+    if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 60)
+    return tostring(wait)
+    """
+
+    ENQUEUE_BATCH_SIZE = 500
+
+    def __init__(self, url, prefix='crawl', visibility_timeout=300, max_attempts=3):
+        if redis is None:
+            raise RuntimeError("The redis package is required for redis:// queues (pip install redis)")
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.keys = {name: self._key(name) for name in self.KEY_NAMES}
+        self._script_keys = [self.keys[name] for name in self.KEY_NAMES]
+        self._enqueue = self.client.register_script(self.ENQUEUE_SCRIPT)
+        self._lease = self.client.register_script(self.LEASE_SCRIPT)
+        self._extend = self.client.register_script(self.EXTEND_SCRIPT)
+        self._complete = self.client.register_script(self.COMPLETE_SCRIPT)
+        self._fail = self.client.register_script(self.FAIL_SCRIPT)
+        self._acquire = self.client.register_script(self.ACQUIRE_SCRIPT)
+
+    def _key(self, name):
+        return f"{{{self.prefix}}}:{name}"
+
+    def enqueue(self, titles):
+        """Queue titles, skipping any already queued, in progress or finished"""
+        added = 0
+        batch = []
+        for title in titles:
+            key = title_key(title)
+            if key:
+                batch.extend((key, title.strip()))
+            if len(batch) >= self.ENQUEUE_BATCH_SIZE * 2:
+                added += self._enqueue(keys=self._script_keys, args=batch)
+                batch = []
+        if batch:
+            added += self._enqueue(keys=self._script_keys, args=batch)
+        return added
+
+    def lease(self, worker_id):
+        """Check out the next available title, or return None if there is none"""
+        result = self._lease(keys=self._script_keys,
+                             args=[worker_id, self.visibility_timeout, self.max_attempts])
+        if not result:
+            return None
+        key, title, attempts = result
+        return Lease(key, title, int(attempts))
+
+    def extend_lease(self, lease, worker_id):
+        """Push the lease's visibility timeout back; False if it was lost"""
+        return bool(self._extend(keys=self._script_keys,
+                                 args=[lease.key, worker_id, self.visibility_timeout]))
+
+    def complete(self, lease, worker_id, reviews, source):
+        """Store the reviews for a leased title; False if the lease was lost"""
+        records = []
+        for review in reviews:
+            record = {field: str(review.get(field, "")) for field in REVIEW_FIELDS}
+            record.update(key=lease.key, movie=lease.title, source=source)
+            records.append(json.dumps(record, ensure_ascii=False))
+        return bool(self._complete(keys=self._script_keys, args=[lease.key, worker_id, *records]))
+
+    def fail(self, lease, worker_id, error):
+        """Release a leased title for a retry, or mark it failed after max_attempts"""
+        return bool(self._fail(keys=self._script_keys,
+                               args=[lease.key, worker_id, error, self.max_attempts]))
+
+    def acquire(self, name, rate, burst=1):
+        """Take a token from the shared bucket; return seconds to wait if empty"""
+        return float(self._acquire(keys=[self._key(f"rate:{name}")], args=[rate, burst]))
+
+    def stats(self):
+        """Count titles per status"""
+        return dict(Counter(state for _, state in
+                            self.client.hscan_iter(self.keys['state'], count=1000)))
+
+    def iter_reviews(self, title=None, batch_size=1000):
+        """Yield stored reviews, optionally only those for one title"""
+        key = title_key(title) if title else None
+        start = 0
+        while True:
+            batch = self.client.lrange(self.keys['reviews'], start, start + batch_size - 1)
+            if not batch:
+                return
+            for record in batch:
+                review = json.loads(record)
+                if review.pop('key') == key or key is None:
+                    yield review
+            start += batch_size
+
+    def close(self):
+        self.client.close()
+
+def open_queue(url, **options):
+    """Open a work queue from a sqlite:///path or redis://host URL"""
+    scheme = urlparse(url).scheme
+    if scheme == 'sqlite':
+        path = url[len('sqlite:///'):] if url.startswith('sqlite:///') else url[len('sqlite://'):]
+        return SQLiteWorkQueue(path, **options)
+    if scheme in ('redis', 'rediss', 'unix'):
+        return RedisWorkQueue(url, **options)
+    raise ValueError(f"Unsupported queue URL: {url}")
+
+class CrawlWorker:
+    """Pulls titles from a shared queue and runs search → scrape → AI fallback"""
+
+    BACKOFF_INITIAL = 1
+    BACKOFF_MAX = 60
+
+    def __init__(self, queue, scraper, ai_generator=None, mode='scrape_fallback', max_reviews=50,
+                 worker_id=None, scrape_rate=1.0, ai_rate=0.2):
+        self.queue = queue
+        self.scraper = scraper
+        self.ai_generator = ai_generator
+        self.mode = mode
+        self.max_reviews = max_reviews
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        # Requests per second shared by every worker on the queue
+        if scrape_rate <= 0 or ai_rate <= 0:
+            raise ValueError("Rate limits must be greater than zero")
+        self.scrape_rate = scrape_rate
+        self.ai_rate = ai_rate
+
+    def _call(self, method, *args):
+        """Call a queue method, backing off and retrying while the backend is unavailable"""
+        delay = self.BACKOFF_INITIAL
+        while True:
+            try:
+                return method(*args)
+            except BACKEND_ERRORS as e:
+                print(f"⚠️ Queue backend error: {e}; retrying in {delay}s")
+                time.sleep(delay)
+                delay = min(delay * 2, self.BACKOFF_MAX)
+
+    def _throttle(self, name, rate):
+        while True:
+            wait = self._call(self.queue.acquire, name, rate)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    def _generate(self, title):
+        if not self.ai_generator or not self.ai_generator.model:
+            return [], "API key not configured"
+        self._throttle('gemini', self.ai_rate)
+        return self.ai_generator.generate_reviews(title, self.max_reviews)
+
+    def _scrape(self, lease):
+        self._throttle('imdb', self.scrape_rate)
+        movie_id, error = self.scraper.search_movie(lease.title)
+        if error:
+            return [], error
+        if not self._call(self.queue.extend_lease, lease, self.worker_id):
+            return [], "Lease lost"
+        self._throttle('imdb', self.scrape_rate)
+        return self.scraper.get_reviews(movie_id, self.max_reviews)
+
+    def process(self, lease):
+        """Collect reviews for a leased title, returning (reviews, source, error)"""
+        if self.mode == 'ai_only':
+            reviews, error = self._generate(lease.title)
+            return reviews, 'ai', error
+
+        reviews, error = self._scrape(lease)
+        if (not error and reviews) or self.mode == 'scrape_only':
+            return reviews, 'imdb', error
+
+        if not self._call(self.queue.extend_lease, lease, self.worker_id):
+            return [], 'ai', "Lease lost"
+        reviews, error = self._generate(lease.title)
+        return reviews, 'ai', error
+
+    def run(self, max_titles=None, poll_interval=5, exit_when_empty=False):
+        """Process titles until the queue is drained or max_titles is reached"""
+        processed = 0
+        while max_titles is None or processed < max_titles:
+            lease = self._call(self.queue.lease, self.worker_id)
+            if lease is None:
+                if exit_when_empty:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            stored = False
+            try:
+                reviews, source, error = self.process(lease)
+                if not error:
+                    stored = self._call(self.queue.complete, lease, self.worker_id, reviews, source)
+            except Exception as e:
+                # e.g. malformed AI output that cannot be stored
+                reviews, source, error = [], None, f"Unexpected error: {str(e)}"
+
+            if error:
+                self._call(self.queue.fail, lease, self.worker_id, error)
+                print(f"❌ {lease.title}: {error} (attempt {lease.attempts})")
+            elif stored:
+                print(f"✅ {lease.title}: {len(reviews)} reviews from {source}")
+            else:
+                print(f"⚠️ {lease.title}: lease lost, results discarded")
+            processed += 1
+
+        return processed
+
+def positive_rate(value):
+    """argparse type for a requests-per-second limit"""
+    rate = float(value)
+    if rate <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than zero, got {value}")
+    return rate
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Distributed movie review crawl")
+    parser.add_argument('--queue', default=os.environ.get('CRAWL_QUEUE', 'sqlite:///crawl.db'),
+                        help="sqlite:///path or redis://host:port/db (default: $CRAWL_QUEUE)")
+    parser.add_argument('--visibility-timeout', type=float, default=300,
+                        help="Seconds before an unfinished lease is handed to another worker")
+    parser.add_argument('--max-attempts', type=int, default=3)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    enqueue_cmd = commands.add_parser('enqueue', help="Queue movie titles")
+    enqueue_cmd.add_argument('titles', nargs='*')
+    enqueue_cmd.add_argument('--file', help="File with one title per line ('-' for stdin)")
+
+    worker_cmd = commands.add_parser('worker', help="Run a crawl worker")
+    worker_cmd.add_argument('--mode', choices=['ai_only', 'scrape_fallback', 'scrape_only'],
+                            default='scrape_fallback')
+    worker_cmd.add_argument('--max-reviews', type=int, default=50)
+    worker_cmd.add_argument('--api-key', default=os.environ.get('GEMINI_API_KEY'))
+    worker_cmd.add_argument('--scrape-rate', type=positive_rate, default=1.0,
+                            help="Global IMDb requests per second across all workers")
+    worker_cmd.add_argument('--ai-rate', type=positive_rate, default=0.2,
+                            help="Global Gemini requests per second across all workers")
+    worker_cmd.add_argument('--streaming', action='store_true', help="Use low-memory streaming extraction")
+    worker_cmd.add_argument('--max-titles', type=int)
+    worker_cmd.add_argument('--exit-when-empty', action='store_true')
+
+    commands.add_parser('status', help="Show title counts per status")
+
+    export_cmd = commands.add_parser('export', help="Append collected reviews to a review archive")
+    export_cmd.add_argument('archive')
+    export_cmd.add_argument('--title', help="Only export reviews for this title")
+
+    args = parser.parse_args(argv)
+    queue = open_queue(args.queue, visibility_timeout=args.visibility_timeout,
+                       max_attempts=args.max_attempts)
+
+    try:
+        if args.command == 'enqueue':
+            titles = list(args.titles)
+            if args.file:
+                with (sys.stdin if args.file == '-' else open(args.file, encoding='utf-8')) as file:
+                    titles.extend(line for line in file if line.strip())
+            added = queue.enqueue(titles)
+            print(f"Queued {added} new titles ({len(titles) - added} already known)")
+
+        elif args.command == 'worker':
+            ai_generator = AIReviewGenerator()
+            if args.mode != 'scrape_only':
+                if not args.api_key:
+                    parser.error("--api-key or GEMINI_API_KEY is required for this mode")
+                if not ai_generator.set_api_key(args.api_key):
+                    parser.error("Failed to configure Gemini API key")
+            worker = CrawlWorker(queue, MovieReviewScraper(streaming=args.streaming), ai_generator,
+                                 mode=args.mode, max_reviews=args.max_reviews,
+                                 scrape_rate=args.scrape_rate, ai_rate=args.ai_rate)
+            print(f"Worker {worker.worker_id} polling {args.queue}")
+            processed = worker.run(max_titles=args.max_titles, exit_when_empty=args.exit_when_empty)
+            print(f"Processed {processed} titles")
+
+        elif args.command == 'status':
+            for status, count in sorted(queue.stats().items()):
+                print(f"{status}: {count}")
+
+        elif args.command == 'export':
+            archive = ReviewArchive(args.archive)
+            try:
+                written = archive.extend(queue.iter_reviews(args.title))
+                print(f"Appended {written} reviews to {args.archive} ({len(archive)} total)")
+            finally:
+                archive.close()
+    finally:
+        queue.close()
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,13 @@ import re
 from urllib.parse import quote
 import json
 import random
+import os
+import mmap
+import codecs
+import struct
+import textwrap
+from collections.abc import Mapping
+from html.parser import HTMLParser
 from datetime import datetime, timedelta
 import google.generativeai as genai
 
@@ -122,8 +129,143 @@ class AIReviewGenerator:
         
         return reviews
 
-class MovieReviewScraper:
+class MovieLinkParser(HTMLParser):
+    """Event-based parser that stops at the first IMDb title link"""
+
+    TITLE_LINK = re.compile(r'/title/tt\d+/')
+
     def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.movie_id = None
+
+    @property
+    def done(self):
+        return self.movie_id is not None
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'a' or self.done:
+            return
+        href = dict(attrs).get('href') or ""
+        if self.TITLE_LINK.search(href):
+            self.movie_id = re.search(r'tt\d+', href).group()
+
+class ReviewStreamParser(HTMLParser):
+    """Event-based review extractor.
+
+    Only the tags open inside the current ``review-container`` and the text
+    of the fields being captured are kept; a review is emitted as soon as
+    its container closes and everything else in the page is dropped.
+    Like the DOM path, only the first ``max_reviews`` containers are read,
+    including any that fail to parse. Unlike it, a ``review-container``
+    nested inside another is treated as part of the outer review.
+    """
+
+    VOID_ELEMENTS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                               'link', 'meta', 'param', 'source', 'track', 'wbr'))
+    FIELDS = {
+        'rating': ('span', 'rating-other-user-rating'),
+        'title': ('a', 'title'),
+        'content': ('div', 'text'),
+        'date': ('span', 'review-date'),
+        'author': ('span', 'display-name-link'),
+    }
+
+    def __init__(self, max_reviews=50):
+        super().__init__(convert_charrefs=True)
+        self.max_reviews = max_reviews
+        self.reviews = []
+        self.containers = 0
+        self._stack = None
+
+    @property
+    def done(self):
+        return self.containers >= self.max_reviews and self._stack is None
+
+    def _start_container(self):
+        self._stack = ['div']
+        self._found = set()
+        self._captures = {}
+        self._values = {}
+        # The rating lives in the first span nested inside the rating span
+        self._rating_depth = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        classes = (dict(attrs).get('class') or "").split()
+
+        if self._stack is None:
+            if tag == 'div' and 'review-container' in classes:
+                self.containers += 1
+                self._start_container()
+            return
+
+        if tag in self.VOID_ELEMENTS:
+            return
+        self._stack.append(tag)
+        depth = len(self._stack)
+
+        if tag == 'span' and self._rating_depth is not None and 'rating' not in self._captures \
+                and 'rating' not in self._values:
+            self._captures['rating'] = (depth, [])
+
+        for field, (field_tag, field_class) in self.FIELDS.items():
+            if field in self._found or tag != field_tag or field_class not in classes:
+                continue
+            self._found.add(field)
+            if field == 'rating':
+                self._rating_depth = depth
+            else:
+                self._captures[field] = (depth, [])
+
+    def handle_data(self, data):
+        if self._stack is None:
+            return
+        for _, parts in self._captures.values():
+            parts.append(data)
+
+    def handle_endtag(self, tag):
+        if self._stack is None or tag in self.VOID_ELEMENTS or tag not in self._stack:
+            return
+
+        # Pop down to the matching tag, implicitly closing unclosed children
+        while True:
+            depth = len(self._stack)
+            closed = self._stack.pop()
+            for field, (field_depth, parts) in list(self._captures.items()):
+                if field_depth == depth:
+                    self._values[field] = "".join(parts)
+                    del self._captures[field]
+            if depth == self._rating_depth:
+                self._rating_depth = None
+            if closed == tag:
+                break
+
+        if not self._stack:
+            self._stack = None
+            self._emit()
+
+    def _emit(self):
+        if 'rating' in self._found and 'rating' not in self._values:
+            print("Error parsing review: rating has no value")
+            return
+
+        self.reviews.append({
+            'rating': self._values.get('rating', "No rating"),
+            'title': self._values['title'].strip() if 'title' in self._values else "No title",
+            'content': self._values['content'].strip() if 'content' in self._values
+                       else "No content available",
+            'date': self._values['date'].strip() if 'date' in self._values else "No date",
+            'author': self._values['author'].strip() if 'author' in self._values else "Anonymous"
+        })
+
+class MovieReviewScraper:
+    STREAM_CHUNK_SIZE = 16 * 1024
+
+    def __init__(self, streaming=False):
+        # In streaming mode pages are parsed chunk by chunk instead of being
+        # buffered and turned into a full DOM
+        self.streaming = streaming
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -133,12 +275,34 @@ class MovieReviewScraper:
             'Connection': 'keep-alive',
         })
 
+    def _stream_into(self, url, parser):
+        """Feed the response body to an HTMLParser until it reports it is done"""
+        with self.session.get(url, timeout=10, stream=True) as response:
+            content_type = response.headers.get('Content-Type', '').lower()
+            encoding = response.encoding if 'charset' in content_type else 'utf-8'
+            decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+            
+            for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                parser.feed(decoder.decode(chunk))
+                if parser.done:
+                    return
+                    
+            parser.feed(decoder.decode(b'', final=True))
+            parser.close()
+
     def search_movie(self, movie_title):
         """Search for movie and return IMDb ID"""
         try:
             search_query = quote(movie_title)
             search_url = f"https://www.imdb.com/find/?q={search_query}&s=tt&ttype=ft"
             
+            if self.streaming:
+                parser = MovieLinkParser()
+                self._stream_into(search_url, parser)
+                if parser.movie_id:
+                    return parser.movie_id, None
+                return None, "Movie not found"
+            
             response = self.session.get(search_url, timeout=10)
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -161,6 +325,12 @@ class MovieReviewScraper:
             reviews = []
             review_url = f"https://www.imdb.com/title/{movie_id}/reviews"
             
+            if self.streaming:
+                parser = ReviewStreamParser(max_reviews)
+                self._stream_into(review_url, parser)
+                reviews = parser.reviews
+                return reviews, None if reviews else "No reviews found"
+            
             response = self.session.get(review_url, timeout=10)
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -211,7 +381,207 @@ class MovieReviewScraper:
         except Exception as e:
             return [], f"Error fetching reviews: {str(e)}"
 
+class ArchivedReview(Mapping):
+    """Read-only view of one archived review; fields are decoded on access"""
+
+    def __init__(self, archive, record):
+        self._archive = archive
+        self._record = record
+
+    def __getitem__(self, key):
+        try:
+            slot = ReviewArchive.FIELDS.index(key)
+        except ValueError:
+            raise KeyError(key)
+        offset, length = self._record[slot * 2], self._record[slot * 2 + 1]
+        return self._archive._decode(offset, length)
+
+    def __iter__(self):
+        return iter(ReviewArchive.FIELDS)
+
+    def __len__(self):
+        return len(ReviewArchive.FIELDS)
+
+class ReviewArchive:
+    """Append-only, memory-mapped review archive.
+
+    The archive is two files: ``<path>`` holds a magic header followed by
+    fixed-width index records (one (offset, length) pair per field) and
+    ``<path>.heap`` holds the UTF-8 field strings. Both are memory-mapped,
+    so opening is instant and any review is reachable in O(1).
+    """
+
+    MAGIC = b'MRVARC02'
+    # Each record also carries its movie and source so one archive can hold
+    # reviews for many titles
+    FIELDS = ('rating', 'title', 'content', 'date', 'author', 'movie', 'source')
+    RECORD = struct.Struct('<' + 'QI' * len(FIELDS))
+    BATCH_SIZE = 1000
+
+    def __init__(self, path):
+        self.path = path
+        self.heap_path = path + '.heap'
+        self._index_map = None
+        self._heap_map = None
+        self._heap_view = None
+
+        if not os.path.exists(self.path):
+            with open(self.path, 'wb') as file:
+                file.write(self.MAGIC)
+            open(self.heap_path, 'wb').close()
+        elif not os.path.exists(self.heap_path):
+            raise ValueError(f"Missing archive heap file: {self.heap_path}")
+
+        with open(self.path, 'rb') as file:
+            magic = file.read(len(self.MAGIC))
+        if magic != self.MAGIC:
+            if magic.startswith(self.MAGIC[:-2]):
+                raise ValueError(f"Unsupported review archive version: {self.path}")
+            raise ValueError(f"Not a review archive: {self.path}")
+
+        self._remap()
+
+    def _remap(self):
+        """(Re)map both files after they have grown"""
+        self._unmap()
+        with open(self.path, 'rb') as file:
+            self._index_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if os.path.getsize(self.heap_path):
+            with open(self.heap_path, 'rb') as file:
+                self._heap_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._heap_view = memoryview(self._heap_map)
+
+    def _unmap(self):
+        if self._heap_view is not None:
+            self._heap_view.release()
+            self._heap_view = None
+        for mapped in (self._heap_map, self._index_map):
+            if mapped is not None:
+                mapped.close()
+        self._heap_map = None
+        self._index_map = None
+
+    def _decode(self, offset, length):
+        if not length:
+            return ""
+        return str(self._heap_view[offset:offset + length], 'utf-8')
+
+    def __len__(self):
+        # A torn trailing record from an interrupted append is ignored
+        return (len(self._index_map) - len(self.MAGIC)) // self.RECORD.size
+
+    def __getitem__(self, index):
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("review index out of range")
+        position = len(self.MAGIC) + index * self.RECORD.size
+        return ArchivedReview(self, self.RECORD.unpack_from(self._index_map, position))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def extend(self, reviews, movie="", source=""):
+        """Append reviews to the archive and return how many were written.
+
+        ``movie`` and ``source`` fill in reviews that do not carry their own.
+        """
+        defaults = {'movie': movie, 'source': source}
+        written = 0
+        index_size = len(self.MAGIC) + len(self) * self.RECORD.size
+        heap_offset = os.path.getsize(self.heap_path)
+        self._unmap()
+        try:
+            # Drop a torn trailing record so new records stay aligned
+            with open(self.path, 'r+b') as index:
+                index.truncate(index_size)
+
+            # Heap bytes are fsynced before the index records that point at
+            # them, so even a power loss never leaves an index entry without
+            # its data
+            with open(self.heap_path, 'ab') as heap, open(self.path, 'ab') as index:
+                records = bytearray()
+                for review in reviews:
+                    slots = []
+                    for field in self.FIELDS:
+                        value = review.get(field)
+                        if value is None:
+                            value = defaults.get(field, "")
+                        data = str(value).encode('utf-8')
+                        heap.write(data)
+                        slots.extend((heap_offset, len(data)))
+                        heap_offset += len(data)
+                    records += self.RECORD.pack(*slots)
+                    written += 1
+
+                    if written % self.BATCH_SIZE == 0:
+                        self._write_records(heap, index, records)
+
+                self._write_records(heap, index, records)
+        finally:
+            self._remap()
+        return written
+
+    @staticmethod
+    def _write_records(heap, index, records):
+        heap.flush()
+        os.fsync(heap.fileno())
+        index.write(records)
+        index.flush()
+        os.fsync(index.fileno())
+        records.clear()
+
+    def close(self):
+        self._unmap()
+
+def write_reviews_txt(reviews, movie, filepath):
+    """Write reviews as a plain-text report"""
+    with open(filepath, 'w', encoding='utf-8') as file:
+        file.write(f"Movie Reviews for: {movie}\n")
+        file.write("=" * 50 + "\n\n")
+        
+        for i, review in enumerate(reviews, 1):
+            file.write(f"Review #{i}\n")
+            file.write(f"Rating: {review['rating']}\n")
+            file.write(f"Title: {review['title']}\n")
+            file.write(f"Author: {review['author']}\n")
+            file.write(f"Date: {review['date']}\n")
+            file.write(f"Content:\n{review['content']}\n")
+            file.write("-" * 30 + "\n\n")
+
+def write_reviews_csv(reviews, filepath, chunk_size=10000):
+    """Write reviews to CSV in chunks so archives never need to fit in memory"""
+    columns = None
+    for start in range(0, len(reviews), chunk_size):
+        end = min(start + chunk_size, len(reviews))
+        chunk = [dict(reviews[i]) for i in range(start, end)]
+        df = pd.DataFrame(chunk, columns=columns)
+        columns = list(df.columns)
+        df.to_csv(filepath, mode='w' if start == 0 else 'a', 
+                  header=start == 0, index=False, encoding='utf-8')
+
+def write_reviews_json(reviews, movie, filepath):
+    """Stream reviews to JSON; the output matches json.dump(..., indent=2)"""
+    with open(filepath, 'w', encoding='utf-8') as file:
+        file.write("{\n")
+        file.write(f'  "movie": {json.dumps(movie, ensure_ascii=False)},\n')
+        file.write(f'  "total_reviews": {len(reviews)},\n')
+        file.write('  "reviews": [\n')
+        
+        for i, review in enumerate(reviews):
+            if i:
+                file.write(",\n")
+            file.write(textwrap.indent(
+                json.dumps(dict(review), indent=2, ensure_ascii=False), "    "))
+            
+        file.write("\n  ]\n}")
+
 class MovieReviewApp:
+    # Rows added to the results view each time it is scrolled near the end
+    PAGE_SIZE = 1000
+
     def __init__(self, root):
         self.root = root
         self.root.title("🎬 AI-Powered Movie Review Generator")
@@ -222,6 +592,9 @@ class MovieReviewApp:
         self.ai_generator = AIReviewGenerator()
         self.reviews = []
         self.current_movie = ""
+        self.current_source = ""
+        self._stats_generation = 0
+        self._loaded_rows = 0
         
         self.setup_ui()
         
@@ -301,6 +674,10 @@ class MovieReviewApp:
         tk.Radiobutton(mode_frame, text="Scrape Only", variable=self.mode_var, 
                       value="scrape_only", bg='#f0f0f0', font=("Arial", 9)).pack(side=tk.LEFT)
         
+        self.streaming_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(options_frame, text="Low-memory streaming", variable=self.streaming_var, 
+                      bg='#f0f0f0', font=("Arial", 9)).pack(side=tk.LEFT, padx=(15, 0))
+        
         # Action buttons
         button_frame = tk.Frame(search_frame, bg='#f0f0f0')
         button_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
@@ -328,28 +705,30 @@ class MovieReviewApp:
         tree_frame = tk.Frame(results_frame, bg='#f0f0f0')
         tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        columns = ('Rating', 'Title', 'Author', 'Date')
+        columns = ('Rating', 'Movie', 'Title', 'Author', 'Date')
         self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=15)
         
         # Configure columns
         self.tree.heading('Rating', text='Rating')
+        self.tree.heading('Movie', text='Movie')
         self.tree.heading('Title', text='Review Title')
         self.tree.heading('Author', text='Author')
         self.tree.heading('Date', text='Date')
         
         self.tree.column('Rating', width=80, anchor=tk.CENTER)
-        self.tree.column('Title', width=350)
+        self.tree.column('Movie', width=150)
+        self.tree.column('Title', width=300)
         self.tree.column('Author', width=150)
         self.tree.column('Date', width=120, anchor=tk.CENTER)
         
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(yscrollcommand=self._on_tree_scroll, xscrollcommand=h_scrollbar.set)
         
         # Pack treeview and scrollbars
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Bind double-click to show full review
         self.tree.bind('<Double-1>', self.show_full_review)
@@ -373,6 +752,16 @@ class MovieReviewApp:
                                        fg='white', font=("Arial", 10, "bold"))
         self.export_json_btn.pack(side=tk.LEFT, padx=5)
         
+        self.save_archive_btn = tk.Button(export_frame, text="💾 Save to Archive", 
+                                        command=self.save_archive, bg='#34495e', 
+                                        fg='white', font=("Arial", 10, "bold"))
+        self.save_archive_btn.pack(side=tk.LEFT, padx=5)
+        
+        self.open_archive_btn = tk.Button(export_frame, text="📂 Open Archive", 
+                                        command=self.open_archive, bg='#16a085', 
+                                        fg='white', font=("Arial", 10, "bold"))
+        self.open_archive_btn.pack(side=tk.LEFT, padx=5)
+        
         # Stats label
         self.stats_label = tk.Label(export_frame, text="No reviews generated", 
                                   font=("Arial", 10), bg='#f0f0f0', fg='#7f8c8d')
@@ -404,6 +793,16 @@ class MovieReviewApp:
             messagebox.showerror("API Error", "Please configure your Gemini API key first.")
             return
             
+        # Clear previous results here on the Tk thread, which is the only
+        # thread that reads the current archive
+        self.tree.delete(*self.tree.get_children())
+        if isinstance(self.reviews, ReviewArchive):
+            self.reviews.close()
+        self.reviews = []
+        self.current_movie = movie_name
+        self.current_source = ""
+        
+        self.scraper.streaming = self.streaming_var.get()
         self.generate_btn.config(state='disabled')
         thread = threading.Thread(target=self.process_reviews, args=(movie_name, mode))
         thread.daemon = True
@@ -411,11 +810,6 @@ class MovieReviewApp:
         
     def process_reviews(self, movie_name, mode):
         try:
-            # Clear previous results
-            self.tree.delete(*self.tree.get_children())
-            self.reviews = []
-            self.current_movie = movie_name
-            
             # Update status
             self.root.after(0, self.progress.start)
             max_reviews = int(self.max_reviews_var.get())
@@ -432,6 +826,8 @@ class MovieReviewApp:
                     return
                     
                 self.reviews = reviews
+                    
+                self.current_source = 'ai'
                 self.root.after(0, lambda: self.status_label.config(
                     text=f"✅ Generated {len(reviews)} AI reviews for '{movie_name}'"))
                 
@@ -450,6 +846,7 @@ class MovieReviewApp:
                     
                     if not scrape_error and reviews:
                         self.reviews = reviews
+                        self.current_source = 'imdb'
                         self.root.after(0, lambda: self.status_label.config(
                             text=f"✅ Scraped {len(reviews)} reviews from IMDb"))
                     else:
@@ -464,6 +861,8 @@ class MovieReviewApp:
                             return
                             
                         self.reviews = ai_reviews
+                            
+                        self.current_source = 'ai'
                         self.root.after(0, lambda: self.status_label.config(
                             text=f"✅ Generated {len(ai_reviews)} AI reviews (scraping failed)"))
                 else:
@@ -478,6 +877,8 @@ class MovieReviewApp:
                         return
                         
                     self.reviews = ai_reviews
+                        
+                    self.current_source = 'ai'
                     self.root.after(0, lambda: self.status_label.config(
                         text=f"✅ Generated {len(ai_reviews)} AI reviews"))
                 
@@ -501,6 +902,8 @@ class MovieReviewApp:
                     return
                     
                 self.reviews = reviews
+                    
+                self.current_source = 'imdb'
                 self.root.after(0, lambda: self.status_label.config(
                     text=f"✅ Scraped {len(reviews)} reviews from IMDb"))
             
@@ -515,33 +918,75 @@ class MovieReviewApp:
             
     def populate_reviews(self):
         """Populate the treeview with reviews"""
-        for i, review in enumerate(self.reviews):
+        total = len(self.reviews)
+        self._loaded_rows = 0
+        self._load_next_page()
+        
+        # Stats read every review, so large archives are scanned off the Tk thread
+        self._stats_generation += 1
+        self.stats_label.config(text=f"Total: {total} reviews | Calculating stats...")
+        thread = threading.Thread(target=self._update_stats, 
+                                  args=(self.reviews, self._stats_generation))
+        thread.daemon = True
+        thread.start()
+        
+    def _load_next_page(self):
+        """Add the next PAGE_SIZE reviews to the treeview"""
+        end = min(self._loaded_rows + self.PAGE_SIZE, len(self.reviews))
+        for i in range(self._loaded_rows, end):
+            review = self.reviews[i]
             # Truncate title for display
             title = review['title'][:60] + "..." if len(review['title']) > 60 else review['title']
             
             self.tree.insert('', 'end', values=(
                 review['rating'],
+                review.get('movie') or self.current_movie,
                 title,
                 review['author'],
                 review['date']
             ))
+        self._loaded_rows = end
         
-        # Update stats
-        total = len(self.reviews)
-        with_rating = sum(1 for r in self.reviews if r['rating'] != "No rating")
-        avg_rating = self._calculate_average_rating()
+    def _on_tree_scroll(self, first, last):
+        """Keep the scrollbar in sync and load more rows near the end"""
+        self.v_scrollbar.set(first, last)
+        if float(last) >= 0.95 and self._loaded_rows < len(self.reviews):
+            self._load_next_page()
         
+    def _update_stats(self, reviews, generation):
+        """Compute stats in the background and show them if still current"""
+        # The archive gets its own mappings so the GUI can close or replace
+        # the current one while the scan is running
+        if isinstance(reviews, ReviewArchive):
+            reviews = ReviewArchive(reviews.path)
+        try:
+            total, with_rating, avg_rating = self._calculate_stats(reviews)
+        except Exception as e:
+            print(f"Error calculating stats: {e}")
+            return
+        finally:
+            if isinstance(reviews, ReviewArchive):
+                reviews.close()
+            
         stats_text = f"Total: {total} reviews | {with_rating} with ratings"
         if avg_rating:
             stats_text += f" | Avg: {avg_rating:.1f}/10"
             
-        self.stats_label.config(text=stats_text)
+        def show():
+            if generation == self._stats_generation:
+                self.stats_label.config(text=stats_text)
+        self.root.after(0, show)
         
-    def _calculate_average_rating(self):
-        """Calculate average rating from reviews"""
-        ratings = []
-        for review in self.reviews:
+    @staticmethod
+    def _calculate_stats(reviews):
+        """Count reviews and average their ratings in a single pass"""
+        total = with_rating = rated = 0
+        rating_sum = 0.0
+        for review in reviews:
+            total += 1
             rating_text = review['rating']
+            if rating_text != "No rating":
+                with_rating += 1
             # Extract numeric rating
             match = re.search(r'(\d+\.?\d*)', rating_text)
             if match:
@@ -552,11 +997,12 @@ class MovieReviewApp:
                         rating = rating * 2
                     elif rating <= 5:  # Assume it's on 5-point scale
                         rating = rating * 2
-                    ratings.append(min(rating, 10))  # Cap at 10
+                    rating_sum += min(rating, 10)  # Cap at 10
+                    rated += 1
                 except ValueError:
                     continue
         
-        return sum(ratings) / len(ratings) if ratings else None
+        return total, with_rating, rating_sum / rated if rated else None
         
     def show_full_review(self, event):
         """Show full review in a new window"""
@@ -582,8 +1028,10 @@ class MovieReviewApp:
             
             tk.Label(details_frame, text=f"⭐ Rating: {review['rating']}", 
                     font=("Arial", 14, "bold"), bg='#f0f0f0', fg='#e74c3c').pack(anchor=tk.W)
-            tk.Label(details_frame, text=f"👤 Author: {review['author']}", 
+            tk.Label(details_frame, text=f"🎬 Movie: {review.get('movie') or self.current_movie}", 
                     font=("Arial", 11), bg='#f0f0f0').pack(anchor=tk.W, pady=(5, 0))
+            tk.Label(details_frame, text=f"👤 Author: {review['author']}", 
+                    font=("Arial", 11), bg='#f0f0f0').pack(anchor=tk.W)
             tk.Label(details_frame, text=f"📅 Date: {review['date']}", 
                     font=("Arial", 11), bg='#f0f0f0').pack(anchor=tk.W)
             
@@ -616,80 +1064,130 @@ class MovieReviewApp:
         messagebox.showerror("Error", error_msg)
         self.status_label.config(text=f"❌ Error: {error_msg}")
         
-    def export_txt(self):
+    def _snapshot_reviews(self):
+        """Reviews a background thread can read while the GUI replaces or closes its own"""
+        if isinstance(self.reviews, ReviewArchive):
+            return ReviewArchive(self.reviews.path)
+        return list(self.reviews)
+        
+    def _run_export(self, work, success_title, error_title, error_prefix):
+        """Run a long export in a daemon thread and report the result on the Tk thread"""
+        reviews = self._snapshot_reviews()
+        buttons = (self.export_txt_btn, self.export_csv_btn, self.export_json_btn, 
+                   self.save_archive_btn)
+        for button in buttons:
+            button.config(state='disabled')
+        self.status_label.config(text=f"⏳ Writing {len(reviews)} reviews...")
+        
+        def finish(show, title, message):
+            for button in buttons:
+                button.config(state='normal')
+            self.status_label.config(text=message)
+            show(title, message)
+            
+        def run():
+            try:
+                message = work(reviews)
+            except Exception as e:
+                message = f"{error_prefix}: {str(e)}"
+                self.root.after(0, lambda: finish(messagebox.showerror, error_title, message))
+            else:
+                self.root.after(0, lambda: finish(messagebox.showinfo, success_title, message))
+            finally:
+                if isinstance(reviews, ReviewArchive):
+                    reviews.close()
+                    
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        
+    def _export(self, write, defaultextension, filetypes, title):
         if not self.reviews:
             messagebox.showwarning("No Data", "No reviews to export.")
             return
             
         filepath = filedialog.asksaveasfilename(
-            defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-            title="Save reviews as TXT"
+            defaultextension=defaultextension,
+            filetypes=filetypes,
+            title=title
         )
         
         if filepath:
-            try:
-                with open(filepath, 'w', encoding='utf-8') as file:
-                    file.write(f"Movie Reviews for: {self.current_movie}\n")
-                    file.write("=" * 50 + "\n\n")
-                    
-                    for i, review in enumerate(self.reviews, 1):
-                        file.write(f"Review #{i}\n")
-                        file.write(f"Rating: {review['rating']}\n")
-                        file.write(f"Title: {review['title']}\n")
-                        file.write(f"Author: {review['author']}\n")
-                        file.write(f"Date: {review['date']}\n")
-                        file.write(f"Content:\n{review['content']}\n")
-                        file.write("-" * 30 + "\n\n")
-                        
-                messagebox.showinfo("Export Successful", f"Reviews exported to {filepath}")
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
+            def work(reviews):
+                write(reviews, filepath)
+                return f"Reviews exported to {filepath}"
+            self._run_export(work, "Export Successful", "Export Error", "Failed to export")
+        
+    def export_txt(self):
+        movie = self.current_movie
+        self._export(lambda reviews, filepath: write_reviews_txt(reviews, movie, filepath),
+                     ".txt", [("Text files", "*.txt"), ("All files", "*.*")], 
+                     "Save reviews as TXT")
                 
     def export_csv(self):
+        self._export(write_reviews_csv, 
+                     ".csv", [("CSV files", "*.csv"), ("All files", "*.*")], 
+                     "Save reviews as CSV")
+                
+    def export_json(self):
+        movie = self.current_movie
+        self._export(lambda reviews, filepath: write_reviews_json(reviews, movie, filepath),
+                     ".json", [("JSON files", "*.json"), ("All files", "*.*")], 
+                     "Save reviews as JSON")
+
+    def save_archive(self):
+        """Append the current reviews to an on-disk review archive"""
         if not self.reviews:
-            messagebox.showwarning("No Data", "No reviews to export.")
+            messagebox.showwarning("No Data", "No reviews to archive.")
             return
             
         filepath = filedialog.asksaveasfilename(
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-            title="Save reviews as CSV"
+            defaultextension=".rva",
+            filetypes=[("Review archives", "*.rva"), ("All files", "*.*")],
+            title="Append reviews to archive",
+            confirmoverwrite=False
         )
         
         if filepath:
-            try:
-                df = pd.DataFrame(self.reviews)
-                df.to_csv(filepath, index=False, encoding='utf-8')
-                messagebox.showinfo("Export Successful", f"Reviews exported to {filepath}")
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
+            if isinstance(self.reviews, ReviewArchive) and \
+                    os.path.abspath(filepath) == os.path.abspath(self.reviews.path):
+                messagebox.showwarning("Archive", "These reviews are already in this archive.")
+                return
                 
-    def export_json(self):
-        if not self.reviews:
-            messagebox.showwarning("No Data", "No reviews to export.")
-            return
+            movie, source = self.current_movie, self.current_source
             
-        filepath = filedialog.asksaveasfilename(
-            defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
-            title="Save reviews as JSON"
+            def work(reviews):
+                archive = ReviewArchive(filepath)
+                try:
+                    written = archive.extend(reviews, movie=movie, source=source)
+                    total = len(archive)
+                finally:
+                    archive.close()
+                return f"Appended {written} reviews to {filepath} ({total} total)"
+            self._run_export(work, "Archive Saved", "Archive Error", "Failed to save archive")
+                
+    def open_archive(self):
+        """Open an on-disk review archive as the current result set"""
+        filepath = filedialog.askopenfilename(
+            filetypes=[("Review archives", "*.rva"), ("All files", "*.*")],
+            title="Open review archive"
         )
         
         if filepath:
             try:
-                data = {
-                    'movie': self.current_movie,
-                    'total_reviews': len(self.reviews),
-                    'reviews': self.reviews
-                }
-                
-                with open(filepath, 'w', encoding='utf-8') as file:
-                    json.dump(data, file, indent=2, ensure_ascii=False)
-                    
-                messagebox.showinfo("Export Successful", f"Reviews exported to {filepath}")
+                archive = ReviewArchive(filepath)
             except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
+                messagebox.showerror("Archive Error", f"Failed to open archive: {str(e)}")
+                return
+                
+            if isinstance(self.reviews, ReviewArchive):
+                self.reviews.close()
+            self.tree.delete(*self.tree.get_children())
+            self.reviews = archive
+            self.current_movie = os.path.splitext(os.path.basename(filepath))[0]
+            self.status_label.config(
+                text=f"📂 Opened archive '{self.current_movie}' with {len(archive)} reviews")
+            self.populate_reviews()
 
 def main():
     root = tk.Tk()
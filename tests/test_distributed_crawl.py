@@ -0,0 +1,224 @@
+import sqlite3
+import time
+
+import pytest
+
+import distributed_crawl
+from distributed_crawl import CrawlWorker, RedisWorkQueue, SQLiteWorkQueue, main
+from movie_scraper import ReviewArchive
+
+VISIBILITY_TIMEOUT = 0.05
+
+
+def expire_leases():
+    time.sleep(VISIBILITY_TIMEOUT * 3)
+
+
+@pytest.fixture(params=['sqlite', 'redis'])
+def make_queue(request, tmp_path, monkeypatch):
+    if request.param == 'sqlite':
+        path = str(tmp_path / "crawl.db")
+        return lambda **options: SQLiteWorkQueue(path, **options)
+
+    pytest.importorskip('redis')
+    pytest.importorskip('lupa')
+    fakeredis = pytest.importorskip('fakeredis')
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(distributed_crawl.redis.Redis, 'from_url',
+                        lambda url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs))
+    return lambda **options: RedisWorkQueue('redis://localhost:6379/0', **options)
+
+
+@pytest.fixture
+def queue(make_queue):
+    queue = make_queue(visibility_timeout=VISIBILITY_TIMEOUT, max_attempts=2)
+    yield queue
+    queue.close()
+
+
+def test_enqueue_deduplicates_titles(queue):
+    assert queue.enqueue(["Alien", "alien ", "  ALIEN", "Heat", ""]) == 2
+    assert queue.enqueue(["Heat", "Up"]) == 1
+    assert queue.stats() == {'pending': 3}
+
+    lease = queue.lease('w1')
+    assert queue.enqueue([lease.title]) == 0
+
+
+def test_lease_hands_out_each_title_once(queue):
+    queue.enqueue(["Alien", "Heat"])
+    first, second = queue.lease('w1'), queue.lease('w2')
+    assert {first.title, second.title} == {"Alien", "Heat"}
+    assert queue.lease('w3') is None
+
+
+def test_expired_lease_is_retried_up_to_max_attempts(queue):
+    queue.enqueue(["Alien"])
+    first = queue.lease('w1')
+    assert first.attempts == 1
+
+    expire_leases()
+    second = queue.lease('w2')
+    assert (second.key, second.attempts) == (first.key, 2)
+
+    expire_leases()
+    assert queue.lease('w3') is None
+    assert queue.stats() == {'failed': 1}
+
+
+def test_fail_releases_for_retry_then_gives_up(queue):
+    queue.enqueue(["Alien"])
+    assert queue.fail(queue.lease('w1'), 'w1', "boom")
+    assert queue.stats() == {'pending': 1}
+    assert queue.fail(queue.lease('w1'), 'w1', "boom again")
+    assert queue.stats() == {'failed': 1}
+
+
+def test_lost_lease_cannot_be_completed_or_extended(queue):
+    queue.enqueue(["Alien"])
+    lost = queue.lease('w1')
+    expire_leases()
+    taken = queue.lease('w2')
+
+    assert not queue.extend_lease(lost, 'w1')
+    assert not queue.complete(lost, 'w1', [{'rating': "1/10"}], 'imdb')
+    assert queue.extend_lease(taken, 'w2')
+    assert queue.complete(taken, 'w2', [{'rating': "9/10"}], 'imdb')
+    assert [review['rating'] for review in queue.iter_reviews()] == ["9/10"]
+
+
+def test_expired_lease_stays_owned_until_taken(queue):
+    queue.enqueue(["Inception"])
+    inception = queue.lease('w1')
+    queue.enqueue(["Heat"])
+    expire_leases()
+
+    # Pending titles are handed out before expired leases are reclaimed
+    assert queue.lease('w2').title == "Heat"
+    assert queue.extend_lease(inception, 'w1')
+    assert queue.complete(inception, 'w1', [], 'imdb')
+
+
+def test_acquire_wait_times(queue):
+    assert queue.acquire('imdb', rate=10) == 0
+    wait = queue.acquire('imdb', rate=10)
+    assert 0 < wait <= 0.1
+    time.sleep(wait + 0.01)
+    assert queue.acquire('imdb', rate=10) == 0
+    # Buckets are independent
+    assert queue.acquire('gemini', rate=10) == 0
+
+
+def test_iter_reviews_by_title(queue):
+    queue.enqueue(["Alien", "Heat"])
+    for worker_id in ('w1', 'w2'):
+        lease = queue.lease(worker_id)
+        queue.complete(lease, worker_id, [{'rating': "8/10", 'title': lease.title}], 'imdb')
+
+    reviews = list(queue.iter_reviews(" alien"))
+    assert [(review['movie'], review['source'], review['title']) for review in reviews] == \
+        [("Alien", 'imdb', "Alien")]
+
+
+class StubScraper:
+    def search_movie(self, title):
+        if title == "Unknown":
+            return None, "Movie not found"
+        return f"tt-{title}", None
+
+    def get_reviews(self, movie_id, max_reviews=50):
+        if movie_id == "tt-No Reviews":
+            return [], "No reviews found"
+        return [{'rating': "7/10", 'title': movie_id, 'content': "", 'date': "", 'author': "a"}], None
+
+
+class StubAIGenerator:
+    model = object()
+
+    def generate_reviews(self, title, num_reviews=50):
+        if title == "Garbled":
+            return ["not a review"], None
+        return [{'rating': "5/10", 'title': f"AI {title}"}], None
+
+
+def make_worker(queue, mode='scrape_fallback'):
+    return CrawlWorker(queue, StubScraper(), StubAIGenerator(), mode=mode, worker_id='w1',
+                       scrape_rate=1000, ai_rate=1000)
+
+
+def test_worker_scrapes_and_falls_back_to_ai(queue):
+    queue.enqueue(["Alien", "Unknown", "No Reviews"])
+    assert make_worker(queue).run(exit_when_empty=True) == 3
+
+    sources = {review['movie']: review['source'] for review in queue.iter_reviews()}
+    assert sources == {"Alien": 'imdb', "Unknown": 'ai', "No Reviews": 'ai'}
+    assert queue.stats() == {'done': 3}
+
+
+def test_worker_scrape_only_fails_title(queue):
+    queue.enqueue(["Unknown"])
+    make_worker(queue, mode='scrape_only').run(exit_when_empty=True)
+    assert queue.stats() == {'failed': 1}
+
+
+def test_worker_survives_unstorable_results(queue):
+    queue.enqueue(["Garbled", "Alien"])
+    worker = make_worker(queue, mode='ai_only')
+    assert worker.run(exit_when_empty=True) == 3
+
+    # The garbled title is released for a retry instead of killing the worker
+    assert queue.stats() == {'done': 1, 'failed': 1}
+    assert [review['movie'] for review in queue.iter_reviews()] == ["Alien"]
+
+
+class FlakyQueue:
+    """Proxy that fails the first call to each queue method"""
+
+    def __init__(self, queue):
+        self.queue = queue
+        self.failed = set()
+
+    def __getattr__(self, name):
+        method = getattr(self.queue, name)
+
+        def call(*args):
+            if name not in self.failed:
+                self.failed.add(name)
+                raise sqlite3.OperationalError("database is locked")
+            return method(*args)
+        return call
+
+
+def test_worker_retries_backend_errors(queue, monkeypatch):
+    monkeypatch.setattr(CrawlWorker, 'BACKOFF_INITIAL', 0)
+    queue.enqueue(["Alien"])
+    worker = make_worker(FlakyQueue(queue))
+    assert worker.run(exit_when_empty=True) == 1
+    assert queue.stats() == {'done': 1}
+
+
+def test_worker_rejects_non_positive_rates(queue):
+    with pytest.raises(ValueError):
+        CrawlWorker(queue, StubScraper(), scrape_rate=0)
+
+
+def test_export_keeps_movie_and_source(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'crawl.db'}"
+    queue = distributed_crawl.open_queue(url)
+    queue.enqueue(["Alien", "Unknown"])
+    make_worker(queue).run(exit_when_empty=True)
+    queue.close()
+
+    archive_path = str(tmp_path / "crawl.rva")
+    main(['--queue', url, 'export', archive_path])
+
+    archive = ReviewArchive(archive_path)
+    assert sorted((review['movie'], review['source']) for review in archive) == \
+        [("Alien", 'imdb'), ("Unknown", 'ai')]
+    archive.close()
+
+
+def test_cli_rejects_zero_rate(capsys):
+    with pytest.raises(SystemExit):
+        main(['--queue', 'sqlite:///:memory:', 'worker', '--mode', 'scrape_only', '--ai-rate', '0'])
+    assert "must be greater than zero" in capsys.readouterr().err
@@ -0,0 +1,136 @@
+import csv
+import json
+
+import pytest
+
+from movie_scraper import ReviewArchive, write_reviews_csv, write_reviews_json
+
+
+def make_reviews(count, start=0):
+    return [{
+        'rating': f"{i % 10 + 1}/10",
+        'title': f"Review {i} – ünïcode",
+        'content': "Great film. " * (i % 5),
+        'date': "1 May 2024",
+        'author': f"User{i}",
+        'movie': f"Movie {i % 3}",
+        'source': "imdb" if i % 2 else "ai",
+    } for i in range(start, start + count)]
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    return str(tmp_path / "reviews.rva")
+
+
+def test_extend_and_read_back(archive_path):
+    archive = ReviewArchive(archive_path)
+    assert len(archive) == 0
+
+    reviews = make_reviews(2500)
+    assert archive.extend(reviews) == 2500
+    assert len(archive) == 2500
+    assert dict(archive[0]) == reviews[0]
+    assert dict(archive[-1]) == reviews[-1]
+    assert [dict(review) for review in archive] == reviews
+    with pytest.raises(IndexError):
+        archive[2500]
+    archive.close()
+
+
+def test_reopen_and_append(archive_path):
+    archive = ReviewArchive(archive_path)
+    archive.extend(make_reviews(3))
+    archive.close()
+
+    archive = ReviewArchive(archive_path)
+    assert len(archive) == 3
+    archive.extend(make_reviews(2, start=3))
+    assert [dict(review) for review in archive] == make_reviews(5)
+    archive.close()
+
+
+def test_missing_fields_are_empty(archive_path):
+    archive = ReviewArchive(archive_path)
+    archive.extend([{'rating': "7/10"}])
+    assert dict(archive[0]) == {'rating': "7/10", 'title': "", 'content': "",
+                                'date': "", 'author': "", 'movie': "", 'source': ""}
+    archive.close()
+
+
+def test_movie_and_source_defaults(archive_path):
+    archive = ReviewArchive(archive_path)
+    archive.extend([{'rating': "7/10"}, {'rating': "3/10", 'movie': "Heat", 'source': "imdb"}],
+                   movie="Alien", source="ai")
+    assert (archive[0]['movie'], archive[0]['source']) == ("Alien", "ai")
+    assert (archive[1]['movie'], archive[1]['source']) == ("Heat", "imdb")
+    archive.close()
+
+
+def test_torn_record_is_ignored_and_overwritten(archive_path):
+    archive = ReviewArchive(archive_path)
+    archive.extend(make_reviews(3))
+    archive.close()
+
+    # Simulate a crash part-way through writing an index record
+    with open(archive_path, 'ab') as index:
+        index.write(b'\x01\x02\x03')
+
+    archive = ReviewArchive(archive_path)
+    assert len(archive) == 3
+
+    new_review = make_reviews(1, start=3)
+    archive.extend(new_review)
+    assert len(archive) == 4
+    assert dict(archive[3]) == new_review[0]
+    archive.close()
+
+    archive = ReviewArchive(archive_path)
+    assert [dict(review) for review in archive] == make_reviews(4)
+    archive.close()
+
+
+def test_rejects_old_format(tmp_path):
+    path = tmp_path / "old.rva"
+    path.write_bytes(b"MRVARC01")
+    (tmp_path / "old.rva.heap").write_bytes(b"")
+    with pytest.raises(ValueError, match="version"):
+        ReviewArchive(str(path))
+
+
+def test_rejects_non_archive(tmp_path):
+    path = tmp_path / "other.rva"
+    path.write_bytes(b"not an archive")
+    (tmp_path / "other.rva.heap").write_bytes(b"")
+    with pytest.raises(ValueError):
+        ReviewArchive(str(path))
+
+
+def test_csv_export_from_archive(archive_path, tmp_path):
+    reviews = make_reviews(25)
+    archive = ReviewArchive(archive_path)
+    archive.extend(reviews)
+
+    output = tmp_path / "reviews.csv"
+    write_reviews_csv(archive, str(output), chunk_size=10)
+    archive.close()
+
+    with open(output, newline='', encoding='utf-8') as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 25
+    assert list(rows[0]) == list(ReviewArchive.FIELDS)
+    assert rows == [{key: review[key] for key in ReviewArchive.FIELDS} for review in reviews]
+
+
+def test_json_export_from_archive_matches_json_dump(archive_path, tmp_path):
+    reviews = make_reviews(4)
+    archive = ReviewArchive(archive_path)
+    archive.extend(reviews)
+
+    output = tmp_path / "reviews.json"
+    write_reviews_json(archive, "Inception", str(output))
+    archive.close()
+
+    expected = {'movie': "Inception", 'total_reviews': 4,
+                'reviews': [{key: review[key] for key in ReviewArchive.FIELDS} for review in reviews]}
+    assert output.read_text(encoding='utf-8') == json.dumps(expected, indent=2, ensure_ascii=False)
@@ -0,0 +1,176 @@
+import pytest
+
+from movie_scraper import MovieLinkParser, MovieReviewScraper, ReviewStreamParser
+
+
+REVIEWS_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Reviews</title></head>
+<body>
+<div class="lister-list">
+  <div class="review-container">
+    <div class="lister-item-content">
+      <div class="ipl-ratings-bar">
+        <span class="rating-other-user-rating">
+          <svg class="ipl-icon"></svg>
+          <span>9</span><span class="point-scale">/10</span>
+        </span>
+      </div>
+      <a href="/review/rw1/" class="title"> A masterpiece &amp; more
+</a>
+      <div class="display-name-date">
+        <span class="display-name-link"><a href="/user/ur1/">Zoë</a></span>
+        <span class="review-date">12 March 2021</span>
+      </div>
+      <div class="content">
+        <div class="text show-more__control">First line.<br/>Second line<br>with <b>bold</b> text.
+          <img src="x.png"><p>An unclosed paragraph
+        </div>
+      </div>
+    </div>
+  </div>
+  <div class="review-container">
+    <span class="rating-other-user-rating">No inner span</span>
+    <a class="title">Broken rating</a>
+  </div>
+  <div class="review-container">
+    <a class="title">No rating here</a>
+    <div class="text">Short and sweet</div>
+  </div>
+  <div class="review-container">
+    <a class="title">Fourth</a>
+    <span class="display-name-link">Late Author</span>
+  </div>
+</div>
+<footer>lots of trailing markup</footer>
+</body></html>
+"""
+
+SEARCH_PAGE = """<html><body>
+<a href="/name/nm0000001/">A person</a>
+<ul><li><a class="ipc-title-link" href="/title/tt0111161/?ref_=fn_tt_tt_1">The Shawshank Redemption</a></li>
+<li><a href="/title/tt0068646/">The Godfather</a></li></ul>
+</body></html>
+"""
+
+
+class FakeResponse:
+    def __init__(self, body, content_type='text/html; charset=utf-8'):
+        self.content = body.encode('utf-8')
+        self.headers = {'Content-Type': content_type}
+        self.encoding = 'utf-8'
+        self.chunks_read = 0
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            self.chunks_read += 1
+            yield self.content[start:start + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    def __init__(self, body):
+        self.body = body
+        self.responses = []
+
+    def get(self, url, timeout=None, stream=False):
+        response = FakeResponse(self.body)
+        self.responses.append(response)
+        return response
+
+
+def make_scraper(body, streaming):
+    scraper = MovieReviewScraper(streaming=streaming)
+    scraper.session = FakeSession(body)
+    # Small chunks split tags, entities and multi-byte characters
+    scraper.STREAM_CHUNK_SIZE = 7
+    return scraper
+
+
+def feed_in_chunks(parser, html, size=5):
+    for start in range(0, len(html), size):
+        parser.feed(html[start:start + size])
+        if parser.done:
+            return
+    parser.close()
+
+
+@pytest.mark.parametrize('max_reviews', [1, 2, 3, 4, 50])
+def test_streaming_matches_dom_extraction(max_reviews):
+    dom_reviews, dom_error = make_scraper(REVIEWS_PAGE, False).get_reviews('tt1', max_reviews)
+    stream_reviews, stream_error = make_scraper(REVIEWS_PAGE, True).get_reviews('tt1', max_reviews)
+    assert stream_reviews == dom_reviews
+    assert stream_error == dom_error
+
+
+def test_review_fields():
+    parser = ReviewStreamParser(max_reviews=50)
+    feed_in_chunks(parser, REVIEWS_PAGE)
+
+    first = parser.reviews[0]
+    assert first['rating'] == "9"
+    assert first['title'] == "A masterpiece & more"
+    assert first['author'] == "Zoë"
+    assert first['date'] == "12 March 2021"
+    # Void tags add no text and the unclosed <p> is closed with its parent
+    assert first['content'].startswith("First line.Second linewith bold text.")
+    assert first['content'].endswith("An unclosed paragraph")
+
+
+def test_rating_without_inner_span_is_skipped_but_counted():
+    parser = ReviewStreamParser(max_reviews=3)
+    feed_in_chunks(parser, REVIEWS_PAGE)
+
+    assert parser.containers == 3
+    assert [review['title'] for review in parser.reviews] == [
+        "A masterpiece & more", "No rating here"]
+    assert parser.reviews[1]['rating'] == "No rating"
+
+
+def test_max_reviews_cut_off_stops_parsing():
+    parser = ReviewStreamParser(max_reviews=1)
+    feed_in_chunks(parser, REVIEWS_PAGE)
+
+    assert parser.done
+    assert len(parser.reviews) == 1
+
+
+def test_no_containers_reports_no_reviews():
+    reviews, error = make_scraper("<html><body>Nothing</body></html>", True).get_reviews('tt1')
+    assert reviews == []
+    assert error == "No reviews found"
+
+
+def test_movie_link_parser_finds_first_title_link():
+    parser = MovieLinkParser()
+    feed_in_chunks(parser, SEARCH_PAGE)
+    assert parser.movie_id == "tt0111161"
+
+
+def test_streaming_search_matches_dom_search():
+    assert make_scraper(SEARCH_PAGE, True).search_movie("Shawshank") == \
+        make_scraper(SEARCH_PAGE, False).search_movie("Shawshank")
+    assert make_scraper("<html></html>", True).search_movie("Nothing") == \
+        (None, "Movie not found")
+
+
+def test_stream_into_returns_early_once_done():
+    scraper = make_scraper(REVIEWS_PAGE, True)
+    reviews, error = scraper.get_reviews('tt1', max_reviews=1)
+
+    response = scraper.session.responses[0]
+    total_chunks = -(-len(response.content) // scraper.STREAM_CHUNK_SIZE)
+    assert len(reviews) == 1 and error is None
+    assert response.chunks_read < total_chunks
+
+
+def test_stream_into_reads_whole_body_when_not_done():
+    scraper = make_scraper(SEARCH_PAGE.replace("/title/", "/other/"), True)
+    assert scraper.search_movie("Nothing") == (None, "Movie not found")
+
+    response = scraper.session.responses[0]
+    assert response.chunks_read == -(-len(response.content) // scraper.STREAM_CHUNK_SIZE)